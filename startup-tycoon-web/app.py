@@ -1,55 +1,207 @@
-from flask import Flask, render_template, request, session, redirect, url_for, jsonify
+from flask import Flask, render_template, request, session, redirect, url_for, jsonify, make_response
 import sqlite3
 import random
 import os
+import atexit
+import collections
+import contextlib
+import json
+import operator
+import threading
+import uuid
 from datetime import datetime
 
-from startup_tycoon_main import Company, ActionType, StartupTycoonGame, Loan
+from startup_tycoon_main import Company, ACTION_KEYS, StartupTycoonGame, Loan, HISTORY_LIMIT
 from swiss_events_manager import SwissEventManager
 
 app = Flask(__name__)
 app.secret_key = 'change-this-later'
 
+# API responses are emoji-heavy: skip key sorting, \u escaping and indentation
+app.json.sort_keys = False
+app.json.ensure_ascii = False
+app.json.compact = True
+
+# Both only hold static action/event tables, so one instance serves all requests
+GAME = StartupTycoonGame()
+EVENT_MANAGER = SwissEventManager()
+
+# Monthly summary shown after each turn
+FINANCE_TEMPLATE = (
+    "Revenue: +{revenue:,} CHF\n"
+    "Expenses: -{expenses:,} CHF\n"
+    "{invested}{event}{loans}"
+    "Total Change: {total_change:+,} CHF\n"
+    "New Balance: {balance:,} CHF"
+)
+
+# Set LEADERBOARD_DB=/dev/shm/leaderboard.db for throwaway tournament
+# leaderboards that should live in RAM instead of on the container's disk
+DB_PATH = os.environ.get('LEADERBOARD_DB', 'leaderboard.db')
+
+# Stored in PRAGMA user_version; bump when the schema below or the
+# game state format changes (2: monthly_loan_payments added to the state)
+SCHEMA_VERSION = 2
+
+INSERT_SCORE_SQL = '''
+    INSERT INTO scores 
+    (player_name, final_score, final_balance, customers, employees, 
+     reputation, product_quality, research_protection, months_survived, 
+     is_bankrupt, outstanding_debt) 
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+SELECT_LEADERBOARD_SQL = '''
+    SELECT player_name AS name, final_score AS score, final_balance AS balance,
+           customers, employees, reputation, product_quality, research_protection,
+           months_survived, is_bankrupt, outstanding_debt, date_played AS date
+    FROM scores 
+    WHERE is_bankrupt = 0 AND months_survived >= 12
+    ORDER BY final_score DESC 
+    LIMIT ?
+'''
+
+# Number of better leaderboard scores and the leaderboard size, in one pass
+PLAYER_RANK_SQL = '''
+    SELECT COALESCE(SUM(final_score > ?), 0), COUNT(*)
+    FROM scores 
+    WHERE is_bankrupt = 0 AND months_survived >= 12
+'''
+
+LAST_SCORE_ID_SQL = 'SELECT MAX(id) FROM scores'
+
+SAVE_GAME_STATE_SQL = '''
+    INSERT OR REPLACE INTO game_states (game_id, state_json, updated_at)
+    VALUES (?, ?, CURRENT_TIMESTAMP)
+'''
+
+LOAD_GAME_STATE_SQL = 'SELECT state_json FROM game_states WHERE game_id = ?'
+
+GAME_STATE_EXISTS_SQL = 'SELECT 1 FROM game_states WHERE game_id = ?'
+
+DELETE_GAME_STATE_SQL = 'DELETE FROM game_states WHERE game_id = ?'
+
+PURGE_GAME_STATES_SQL = "DELETE FROM game_states WHERE updated_at < datetime('now', ?)"
+
+# Abandoned games are removed after this many hours without a turn
+GAME_STATE_TTL_HOURS = 24
+
+# One connection per worker thread, reused across requests
+_tls = threading.local()
+_connections = {}
+_connections_lock = threading.Lock()
+_init_lock = threading.Lock()
+_db_initialized = False
+
+def get_conn():
+    """Return this thread's SQLite connection, opening it on first use"""
+    conn = getattr(_tls, 'conn', None)
+    if conn is not None:
+        return conn
+    
+    conn = sqlite3.connect(DB_PATH, isolation_level=None, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA mmap_size=268435456')
+    conn.execute('PRAGMA cache_size=-20000')
+    _tls.conn = conn
+    
+    with _connections_lock:
+        # Close connections left behind by threads that have exited
+        alive = {t.ident for t in threading.enumerate()}
+        for ident in [i for i in _connections if i not in alive]:
+            _connections.pop(ident).close()
+        _connections[threading.get_ident()] = conn
+    
+    return conn
+
+@atexit.register
+def close_connections():
+    """Close all open SQLite connections on interpreter shutdown"""
+    with _connections_lock:
+        for conn in _connections.values():
+            conn.close()
+        _connections.clear()
+
+@contextlib.contextmanager
+def transaction(conn, mode=''):
+    """Run the block in one explicit transaction, or join the one already open"""
+    if conn.in_transaction:
+        yield conn
+        return
+    
+    conn.execute(f'BEGIN {mode}')
+    try:
+        yield conn
+    except BaseException:
+        conn.execute('ROLLBACK')
+        raise
+    conn.execute('COMMIT')
+
 def init_db():
-    conn = sqlite3.connect('leaderboard.db')
-    c = conn.cursor()
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS scores (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            player_name TEXT NOT NULL,
-            final_score INTEGER NOT NULL,
-            final_balance INTEGER NOT NULL,
-            customers INTEGER NOT NULL,
-            employees INTEGER NOT NULL,
-            reputation REAL NOT NULL,
-            product_quality REAL NOT NULL,
-            research_protection INTEGER DEFAULT 0,
-            months_survived INTEGER NOT NULL,
-            is_bankrupt BOOLEAN DEFAULT 0,
-            outstanding_debt INTEGER DEFAULT 0,
-            date_played TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    conn.commit()
-    conn.close()
+    global _db_initialized
+    with _init_lock:
+        if _db_initialized:
+            return
+        conn = get_conn()
+        # Cheap read on every boot; the DDL and its write lock only run once
+        if conn.execute('PRAGMA user_version').fetchone()[0] < SCHEMA_VERSION:
+            create_schema(conn)
+        _db_initialized = True
+
+def create_schema(conn):
+    """Create tables and indexes and stamp the schema version"""
+    # IMMEDIATE takes the write lock up front, so workers booting together queue here
+    with transaction(conn, 'IMMEDIATE'):
+        # Another worker may have created the schema while we waited for the lock
+        if conn.execute('PRAGMA user_version').fetchone()[0] >= SCHEMA_VERSION:
+            return
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS scores (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                player_name TEXT NOT NULL,
+                final_score INTEGER NOT NULL,
+                final_balance INTEGER NOT NULL,
+                customers INTEGER NOT NULL,
+                employees INTEGER NOT NULL,
+                reputation REAL NOT NULL,
+                product_quality REAL NOT NULL,
+                research_protection INTEGER DEFAULT 0,
+                months_survived INTEGER NOT NULL,
+                is_bankrupt BOOLEAN DEFAULT 0,
+                outstanding_debt INTEGER DEFAULT 0,
+                date_played TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        # Partial covering index: the leaderboard query is answered from the
+        # index in score order without touching the table or sorting
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_scores_leaderboard ON scores (
+                final_score DESC, player_name, final_balance, customers, employees,
+                reputation, product_quality, research_protection, months_survived,
+                is_bankrupt, outstanding_debt, date_played
+            ) WHERE is_bankrupt = 0 AND months_survived >= 12
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS game_states (
+                game_id TEXT PRIMARY KEY,
+                state_json BLOB NOT NULL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        # Saved games from an older version no longer match the state format;
+        # their players are sent back home to start a new game
+        conn.execute('DELETE FROM game_states')
+        conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
 
 def save_score(company_dict, final_score):
     """Save score only if survived 12 months and not bankrupt"""
     if company_dict.get('is_bankrupt', True) or company_dict.get('months_survived', 0) < 12:
-        return
-        
-    conn = sqlite3.connect('leaderboard.db')
-    c = conn.cursor()
+        return False
     
-    outstanding_debt = sum(loan['amount'] for loan in company_dict.get('loans', []))
-    
-    c.execute('''
-        INSERT INTO scores 
-        (player_name, final_score, final_balance, customers, employees, 
-         reputation, product_quality, research_protection, months_survived, 
-         is_bankrupt, outstanding_debt) 
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (
+    get_conn().execute(INSERT_SCORE_SQL, (
         company_dict['owner_name'],
         final_score,
         company_dict['balance'],
@@ -60,37 +212,57 @@ def save_score(company_dict, final_score):
         company_dict['research_protection'],
         company_dict['months_survived'],
         company_dict['is_bankrupt'],
-        outstanding_debt
+        company_dict['outstanding_debt']
     ))
-    conn.commit()
-    conn.close()
+    return True
 
 def get_leaderboard(limit=10):
-    """Load leaderboard from database"""
-    conn = sqlite3.connect('leaderboard.db')
-    c = conn.cursor()
-    c.execute('''
-        SELECT player_name, final_score, final_balance, customers, employees,
-               reputation, product_quality, research_protection, months_survived, 
-               is_bankrupt, outstanding_debt, date_played 
-        FROM scores 
-        WHERE is_bankrupt = 0 AND months_survived >= 12
-        ORDER BY final_score DESC 
-        LIMIT ?
-    ''', (limit,))
-    results = c.fetchall()
-    conn.close()
+    """Load leaderboard from database, cached until the scores table changes"""
+    conn = get_conn()
+    
+    # Scores are insert-only, so the newest id identifies the table contents
+    version = conn.execute(LAST_SCORE_ID_SQL).fetchone()[0]
+    cache = getattr(_tls, 'leaderboard_cache', None)
+    if cache is None or cache['version'] != version:
+        cache = _tls.leaderboard_cache = {'version': version, 'rows': {}}
+    elif limit in cache['rows']:
+        return cache['rows'][limit]
     
-    return [{
-        'name': r[0], 'score': r[1], 'balance': r[2], 
-        'customers': r[3], 'employees': r[4], 'reputation': r[5],
-        'product_quality': r[6], 'research_protection': r[7],
-        'months_survived': r[8], 'is_bankrupt': r[9],
-        'outstanding_debt': r[10], 'date': r[11]
-    } for r in results]
+    # Rows support entry['score'] and, in templates, entry.score
+    board = conn.execute(SELECT_LEADERBOARD_SQL, (limit,)).fetchall()
+    cache['rows'][limit] = board
+    return board
+
+def get_player_rank(final_score, is_saved):
+    """Return (rank, total_players) of a final score among all leaderboard scores"""
+    better, saved = get_conn().execute(PLAYER_RANK_SQL, (final_score,)).fetchone()
+    # A player who did not make it onto the leaderboard still counts as playing
+    return better + 1, saved if is_saved else saved + 1
+
+def save_game_state(game_id, company):
+    """Store the game state server-side under its game id"""
+    state = json.dumps(company_to_state(company), separators=(',', ':'), ensure_ascii=False)
+    get_conn().execute(SAVE_GAME_STATE_SQL, (game_id, state))
+
+def load_game_state(game_id):
+    """Load the Company for a game id, or None if it no longer exists"""
+    row = get_conn().execute(LOAD_GAME_STATE_SQL, (game_id,)).fetchone()
+    return state_to_company(json.loads(row[0])) if row else None
+
+def game_state_exists(game_id):
+    """Check whether a game id still has stored state, without loading it"""
+    return get_conn().execute(GAME_STATE_EXISTS_SQL, (game_id,)).fetchone() is not None
+
+def delete_game_state(game_id):
+    """Remove a finished game's state"""
+    get_conn().execute(DELETE_GAME_STATE_SQL, (game_id,))
+
+def purge_stale_game_states():
+    """Remove abandoned games that have not been played for a while"""
+    get_conn().execute(PURGE_GAME_STATES_SQL, (f'-{GAME_STATE_TTL_HOURS} hours',))
 
 def company_to_dict(company):
-    """Convert Company object to dictionary for session storage"""
+    """Convert Company object to dictionary for game state storage"""
     return {
         'owner_name': company.owner_name,
         'balance': company.balance,
@@ -105,21 +277,41 @@ def company_to_dict(company):
         'months_survived': company.months_survived,
         'is_bankrupt': company.is_bankrupt,
         'loans': [{'amount': loan.amount, 'months_remaining': loan.months_remaining, 'monthly_payment': loan.monthly_payment} for loan in company.loans],
-        'history': company.history
+        'outstanding_debt': company.outstanding_debt,
+        'history': list(company.history)
     }
 
-def dict_to_company(data):
-    """Convert dictionary back to Company object"""
-    company = Company(data['owner_name'])
-    for key, value in data.items():
-        if key != 'loans':
-            setattr(company, key, value)
-    
-    company.loans = []
-    for loan_data in data.get('loans', []):
-        loan = Loan(loan_data['amount'], loan_data['months_remaining'], loan_data['monthly_payment'])
-        company.loans.append(loan)
-    
+# Field order of the flat game state, history last; the loans follow it.
+# state_to_company unpacks in the same order, keep both in sync.
+_COMPANY_FIELDS = (
+    'owner_name', 'balance', 'customers', 'employees', 'reputation',
+    'product_quality', 'research_protection', 'monthly_revenue', 'monthly_expenses',
+    'month', 'marketing_boost', 'no_revenue_this_month', 'months_survived',
+    'is_bankrupt', 'outstanding_debt', 'monthly_loan_payments', 'history'
+)
+
+# Reads all scalar fields in one C-level call, already as a tuple
+_get_scalar_fields = operator.attrgetter(*_COMPANY_FIELDS[:-1])
+
+def company_to_state(company):
+    """Flatten Company object into a tuple of primitives for game state storage"""
+    return _get_scalar_fields(company) + (
+        list(company.history),
+        [(loan.amount, loan.months_remaining, loan.monthly_payment) for loan in company.loans],
+    )
+
+def state_to_company(state):
+    """Rebuild Company object from a flat game state tuple"""
+    # Every attribute is restored below, so __init__'s defaults are skipped
+    company = Company.__new__(Company)
+    (company.owner_name, company.balance, company.customers, company.employees,
+     company.reputation, company.product_quality, company.research_protection,
+     company.monthly_revenue, company.monthly_expenses, company.month,
+     company.marketing_boost, company.no_revenue_this_month, company.months_survived,
+     company.is_bankrupt, company.outstanding_debt, company.monthly_loan_payments,
+     history, loans) = state
+    company.history = collections.deque(history, maxlen=HISTORY_LIMIT)
+    company.loans = [Loan(*loan) for loan in loans]
     return company
 
 @app.route('/')
@@ -144,7 +336,12 @@ def start_game():
     
     company = Company(player_name)
     
-    session['company'] = company_to_dict(company)
+    purge_stale_game_states()
+    game_id = uuid.uuid4().hex
+    save_game_state(game_id, company)
+    
+    session.pop('company', None)
+    session['game_id'] = game_id
     session['current_month'] = 1
     
     return redirect(url_for('game'))
@@ -152,88 +349,93 @@ def start_game():
 @app.route('/game')
 def game():
     """Main game page"""
-    if 'company' not in session:
+    if 'game_id' not in session:
         return redirect(url_for('home'))
     
-    company_dict = session['company']
+    # A purged or finished game must not be served from the client's cache
+    if not game_state_exists(session['game_id']):
+        return redirect(url_for('home'))
+    
+    # The page only changes when a turn advances the month, so a reload of an
+    # unchanged page is answered before loading the state or rendering
     current_month = session.get('current_month', 1)
+    etag = f"{session['game_id']}-{current_month}"
+    if etag in request.if_none_match:
+        response = make_response('', 304)
+        response.set_etag(etag)
+        return response
     
-    return render_template('game.html', 
-                         company=company_dict,
-                         current_month=current_month)
+    company = load_game_state(session['game_id'])
+    if company is None:
+        return redirect(url_for('home'))
+    
+    response = make_response(render_template('game.html', 
+                                             company=company_to_dict(company),
+                                             current_month=current_month))
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+def _handle_turn_active(company, current_month, action_cost, balance_before_action):
+    """Trigger the random event and settle the month for a running company"""
+    event_result = EVENT_MANAGER.trigger_random_event(company)
+    
+    company.month = current_month
+    balance_after_event = company.balance
+    
+    revenue, expenses, _ = company.process_monthly_finances()
+    loan_status = company.process_loan_payments()
+    
+    balance_after_finances = company.balance
+    event_change = balance_after_event - (balance_before_action - action_cost)
+    
+    # Optional lines carry their own newline and are empty when inactive
+    finance_text = FINANCE_TEMPLATE.format_map({
+        'revenue': revenue,
+        'expenses': expenses,
+        'invested': f"Invested: -{action_cost:,} CHF\n" if action_cost > 0 else '',
+        'event': f"Event: {event_change:+,} CHF\n" if event_change != 0 else '',
+        'loans': f"{loan_status}\n" if loan_status else '',
+        'total_change': balance_after_finances - balance_before_action,
+        'balance': balance_after_finances,
+    })
+    return event_result, finance_text
+
+def _handle_turn_bankrupt(company, current_month, action_cost, balance_before_action):
+    """A bankrupt company gets neither events nor finances"""
+    return "Company is bankrupt - no more events.", "No finances - Company bankrupt."
 
 @app.route('/api/complete_turn', methods=['POST'])
 def complete_turn():
     """Complete game turn: Action -> Event -> Finances -> Month advance"""
-    if 'company' not in session:
+    company = load_game_state(session['game_id']) if 'game_id' in session else None
+    if company is None:
         return jsonify({'success': False, 'error': 'No active game'}), 400
     
     data = request.get_json()
     action_type = data.get('action')
     
-    company = dict_to_company(session['company'])
     current_month = session.get('current_month', 1)
     
-    game = StartupTycoonGame()
-    event_manager = SwissEventManager()
-    
     try:
         # 1. Execute action
         try:
-            action_enum = ActionType(action_type)
-        except ValueError:
+            action_enum = ACTION_KEYS[action_type]
+        except (KeyError, TypeError):
             return jsonify({'success': False, 'error': f'Invalid action: {action_type}'}), 400
         
-        action = game.actions[action_enum]
+        action = GAME.actions[action_enum]
         action_cost = action.cost
         balance_before_action = company.balance
         
-        action_result = game.execute_action(company, action_enum)
+        action_result = GAME.execute_action(company, action_enum)
         
-        # 2. Trigger random event (only if not bankrupt)
-        if not company.is_bankrupt:
-            event_result = event_manager.trigger_random_event(company)
-        else:
-            event_result = "Company is bankrupt - no more events."
-            
-        # 3. Process monthly finances (only if not bankrupt)
-        if not company.is_bankrupt:
-            company.month = current_month
-            balance_after_event = company.balance
-            
-            finances = company.process_monthly_finances()
-            loan_status = company.process_loan_payments()
-            
-            balance_after_finances = company.balance
-            event_change = balance_after_event - (balance_before_action - action_cost)
-            
-            finance_parts = [
-                f"Revenue: +{finances['revenue']:,} CHF",
-                f"Expenses: -{finances['expenses']:,} CHF"
-            ]
-            
-            if action_cost > 0:
-                finance_parts.append(f"Invested: -{action_cost:,} CHF")
-            
-            if event_change != 0:
-                if event_change > 0:
-                    finance_parts.append(f"Event: +{event_change:,} CHF")
-                else:
-                    finance_parts.append(f"Event: {event_change:,} CHF")
-            
-            if loan_status:
-                finance_parts.append(loan_status)
-            
-            total_change = balance_after_finances - balance_before_action
-            if total_change >= 0:
-                finance_parts.append(f"Total Change: +{total_change:,} CHF")
-            else:
-                finance_parts.append(f"Total Change: {total_change:,} CHF")
-            
-            finance_parts.append(f"New Balance: {balance_after_finances:,} CHF")
-            finance_text = "\n".join(finance_parts)
-        else:
-            finance_text = "No finances - Company bankrupt."
+        # 2.+3. Random event and monthly finances; the action may have just
+        # declared bankruptcy, so the branch is picked after it
+        handle_turn = _handle_turn_bankrupt if company.is_bankrupt else _handle_turn_active
+        event_result, finance_text = handle_turn(company, current_month, action_cost,
+                                                 balance_before_action)
         
         # 4. Advance month
         current_month += 1
@@ -245,7 +447,7 @@ def complete_turn():
                     company.is_bankrupt or 
                     company.balance < -5000)
         
-        session['company'] = company_to_dict(company)
+        save_game_state(session['game_id'], company)
         
         return jsonify({
             'success': True,
@@ -263,57 +465,38 @@ def complete_turn():
 @app.route('/game_over')
 def game_over():
     """Show game end page"""
-    if 'company' not in session:
+    company = load_game_state(session['game_id']) if 'game_id' in session else None
+    if company is None:
         return redirect(url_for('home'))
     
-    company_dict = session['company']
+    company_dict = company_to_dict(company)
     
     final_score = (company_dict['balance'] + 
                   (company_dict['customers'] * 10) + 
                   (company_dict['reputation'] * 1000) + 
                   (company_dict['product_quality'] * 1000))
     
-    save_score(company_dict, int(final_score))
-    leaderboard = get_leaderboard()
-    
-    # Initialize event manager for humorous messages
-    event_manager = SwissEventManager()
-    
-    # Calculate player's rank for contextual humor
-    # Find where this player would rank in the leaderboard
-    player_rank = 1
-    total_players = len(leaderboard) + 1  # +1 for current player
-    
-    for i, entry in enumerate(leaderboard):
-        if final_score > entry['score']:
-            player_rank = i + 1
-            break
-        else:
-            player_rank = i + 2  # Player ranks after this entry
-    
-    # If leaderboard is empty or player has lowest score
-    if not leaderboard:
-        player_rank = 1
-        total_players = 1
-    elif final_score <= (leaderboard[-1]['score'] if leaderboard else 0):
-        player_rank = len(leaderboard) + 1
-    
-    # Convert dict back to Company object temporarily for the message functions
-    temp_company = dict_to_company(company_dict)
+    # Save, read the top 10 and rank the player in a single transaction
+    with transaction(get_conn()):
+        is_saved = save_score(company_dict, int(final_score))
+        leaderboard = get_leaderboard()
+        
+        # Calculate player's rank for contextual humor
+        player_rank, total_players = get_player_rank(int(final_score), is_saved)
     
     # Get humorous messages
-    humorous_message = event_manager.get_humorous_endgame_message(
-        temp_company, player_rank, total_players
+    humorous_message = EVENT_MANAGER.get_humorous_endgame_message(
+        company, player_rank, total_players
     )
     
     bankruptcy_message = None
     if company_dict.get('is_bankrupt', False):
-        bankruptcy_message = event_manager.get_bankruptcy_message()
+        bankruptcy_message = EVENT_MANAGER.get_bankruptcy_message()
     
-    achievements = event_manager.get_special_achievement_messages(temp_company)
+    achievements = EVENT_MANAGER.get_special_achievement_messages(company)
     
     # Clean up session
-    session.pop('company', None)
+    delete_game_state(session.pop('game_id'))
     session.pop('current_month', None)
     
     return render_template('game_over.html', 
@@ -5,23 +5,43 @@ Web-based business simulation game for St. Gallen startups.
 """
 
 import random
-from typing import Dict
-from dataclasses import dataclass
-from enum import Enum
+from collections import deque
+from typing import List, Optional, Tuple
+from dataclasses import dataclass, field
+from enum import IntEnum
+from types import MappingProxyType
 
 
-class ActionType(Enum):
-    MARKETING = "marketing"
-    DEVELOPMENT = "development"
-    HIRING = "hiring"
-    RESEARCH = "research"
-    EXPANSION = "expansion"
-    NOTHING = "nothing"
-    TAKE_LOAN = "take_loan"
-    GO_BANKRUPT = "go_bankrupt"
+# Only the most recent history entries are kept (and stored with the game state)
+HISTORY_LIMIT = 24
 
+# Terms of the emergency bank loan; its approval message never changes
+EMERGENCY_LOAN_AMOUNT = 5000
+EMERGENCY_LOAN_PAYMENT = 2000
+EMERGENCY_LOAN_MONTHS = 3
+_EMERGENCY_LOAN_MESSAGE = (
+    f"🏛️ Emergency loan approved! +{EMERGENCY_LOAN_AMOUNT:,} CHF "
+    f"(Repay {EMERGENCY_LOAN_PAYMENT:,} CHF/month for {EMERGENCY_LOAN_MONTHS} months)"
+)
 
-@dataclass
+
+class ActionType(IntEnum):
+    # Values are consecutive from 0 so members can index _ACTIONS_BY_TYPE
+    MARKETING = 0
+    DEVELOPMENT = 1
+    HIRING = 2
+    RESEARCH = 3
+    EXPANSION = 4
+    NOTHING = 5
+    TAKE_LOAN = 6
+    GO_BANKRUPT = 7
+
+
+# Action keys as sent by the web client, e.g. 'marketing' or 'take_loan'
+ACTION_KEYS = MappingProxyType({action.name.lower(): action for action in ActionType})
+
+
+@dataclass(frozen=True, slots=True)
 class GameAction:
     name: str
     cost: int
@@ -29,41 +49,42 @@ class GameAction:
     action_type: ActionType
 
 
-@dataclass
+@dataclass(slots=True)
 class Loan:
     amount: int
     months_remaining: int
     monthly_payment: int
 
 
+@dataclass(slots=True)
 class Company:
     """Represents a player's startup company in St. Gallen."""
     
-    def __init__(self, owner_name: str):
-        self.owner_name = owner_name
-        self.balance = 10000  # Starting money in CHF
-        self.customers = 50
-        self.employees = 1
-        self.reputation = 1.0
-        self.product_quality = 1.0
-        self.research_protection = 0
-        self.monthly_revenue = 0
-        self.monthly_expenses = 500
-        self.history = []
-        self.month = 1
-        self.loans = []
-        self.is_bankrupt = False
-        
-        # Swiss events specific attributes
-        self.marketing_boost = 0
-        self.no_revenue_this_month = False
-        self.months_survived = 0
+    owner_name: str
+    balance: int = 10000  # Starting money in CHF
+    customers: int = 50
+    employees: int = 1
+    reputation: float = 1.0
+    product_quality: float = 1.0
+    research_protection: int = 0
+    monthly_revenue: int = 0
+    monthly_expenses: int = 500
+    history: deque = field(default_factory=lambda: deque(maxlen=HISTORY_LIMIT))
+    month: int = 1
+    loans: List[Loan] = field(default_factory=list)
+    outstanding_debt: int = 0  # Kept in sync with the sum of loan amounts
+    monthly_loan_payments: int = 0  # Kept in sync with the sum of loan payments
+    is_bankrupt: bool = False
+    
+    # Swiss events specific attributes
+    marketing_boost: int = 0
+    no_revenue_this_month: bool = False
+    months_survived: int = 0
         
     def calculate_score(self) -> int:
         """Calculate company's total score/value."""
-        total_debt = sum(loan.amount for loan in self.loans)
         return int(self.balance + (self.customers * 10) + 
-                  (self.reputation * 1000) + (self.product_quality * 1000) - total_debt)
+                  (self.reputation * 1000) + (self.product_quality * 1000) - self.outstanding_debt)
     
     def can_afford(self, cost: int) -> bool:
         """Check if company can afford an action."""
@@ -74,57 +95,63 @@ class Company:
         return self.balance < 0
     
     def get_total_debt(self) -> int:
-        """Calculate total outstanding loan debt."""
-        return sum(loan.amount for loan in self.loans)
+        """Return total outstanding loan debt."""
+        return self.outstanding_debt
     
     def get_monthly_loan_payments(self) -> int:
         """Calculate total monthly loan payments."""
-        return sum(loan.monthly_payment for loan in self.loans)
+        return self.monthly_loan_payments
     
-    def process_loan_payments(self) -> str:
-        """Process monthly loan payments and return status."""
+    def process_loan_payments(self) -> Optional[str]:
+        """Process monthly loan payments and return status, or None without loans."""
         if not self.loans:
-            return ""
+            return None
         
-        total_payment = self.get_monthly_loan_payments()
+        total_payment = self.monthly_loan_payments
         self.balance -= total_payment
         
-        completed_loans = []
-        for loan in self.loans:
+        # Pay, compact in place and re-sum the totals in a single pass over the loans
+        loans = self.loans
+        kept = 0
+        outstanding_debt = 0
+        monthly_loan_payments = 0
+        for loan in loans:
             loan.months_remaining -= 1
             loan.amount = max(0, loan.amount - loan.monthly_payment)
-            if loan.months_remaining <= 0 or loan.amount <= 0:
-                completed_loans.append(loan)
-        
-        for loan in completed_loans:
-            self.loans.remove(loan)
-        
-        status = f"💳 Loan payments: -{total_payment:,} CHF"
-        if completed_loans:
-            status += f" ({len(completed_loans)} loan(s) paid off!)"
+            if loan.months_remaining > 0 and loan.amount > 0:
+                loans[kept] = loan
+                kept += 1
+                outstanding_debt += loan.amount
+                monthly_loan_payments += loan.monthly_payment
+        completed = len(loans) - kept
+        del loans[kept:]
+        self.outstanding_debt = outstanding_debt
+        self.monthly_loan_payments = monthly_loan_payments
         
-        return status
+        suffix = f" ({completed} loan(s) paid off!)" if completed else ""
+        return f"💳 Loan payments: -{total_payment:,} CHF{suffix}"
     
     def take_emergency_loan(self) -> str:
         """Take an emergency loan to avoid bankruptcy."""
-        loan_amount = 5000
-        monthly_payment = 2000
-        months = 3
+        self.loans.append(Loan(EMERGENCY_LOAN_AMOUNT, EMERGENCY_LOAN_MONTHS, EMERGENCY_LOAN_PAYMENT))
+        self.outstanding_debt += EMERGENCY_LOAN_AMOUNT
+        self.monthly_loan_payments += EMERGENCY_LOAN_PAYMENT
+        self.balance += EMERGENCY_LOAN_AMOUNT
         
-        self.loans.append(Loan(loan_amount, months, monthly_payment))
-        self.balance += loan_amount
-        
-        return f"🏛️ Emergency loan approved! +{loan_amount:,} CHF (Repay {monthly_payment:,} CHF/month for {months} months)"
+        return _EMERGENCY_LOAN_MESSAGE
     
-    def process_monthly_finances(self) -> Dict[str, int]:
-        """Calculate and apply monthly revenue and expenses."""
+    def process_monthly_finances(self) -> Tuple[int, int, int]:
+        """Calculate and apply monthly revenue and expenses.
+
+        Returns (revenue, expenses, net_income).
+        """
         if self.no_revenue_this_month:
             self.monthly_revenue = 0
             self.no_revenue_this_month = False
         else:
-            base_revenue_per_customer = 5 + random.uniform(0, 3)
-            self.monthly_revenue = int(self.customers * self.product_quality * 
-                                     self.reputation * base_revenue_per_customer)
+            # 5-8 CHF per customer, drawn inline in the same product
+            self.monthly_revenue = int(self.customers * self.product_quality *
+                                       self.reputation * (5.0 + 3.0 * random.random()))
         
         self.monthly_expenses = max(100, 500 + (self.employees * 2000))
         
@@ -133,69 +160,97 @@ class Company:
         
         self.months_survived = self.month
         
-        return {
-            'revenue': self.monthly_revenue,
-            'expenses': self.monthly_expenses,
-            'net_income': net_income
-        }
+        return self.monthly_revenue, self.monthly_expenses, net_income
+    
+    def lose_customers(self, count: int):
+        """Remove customers, never dropping below zero."""
+        customers = self.customers - count
+        self.customers = 0 if customers < 0 else customers
+    
+    def lose_reputation(self, amount: float):
+        """Lower reputation, never dropping below 0.1."""
+        reputation = self.reputation - amount
+        self.reputation = 0.1 if reputation < 0.1 else reputation
+    
+    def lose_quality(self, amount: float):
+        """Lower product quality, never dropping below 0.1."""
+        quality = self.product_quality - amount
+        self.product_quality = 0.1 if quality < 0.1 else quality
     
     def add_history_entry(self, entry: str):
         """Add an entry to the company's history."""
         self.history.append(f"Month {self.month}: {entry}")
 
 
+# Available actions, built once and shared read-only by every game
+ACTIONS = MappingProxyType({
+    ActionType.MARKETING: GameAction(
+        "HSG Campus Marketing", 1500,
+        "Target wealthy HSG students with premium marketing campaign",
+        ActionType.MARKETING
+    ),
+    ActionType.DEVELOPMENT: GameAction(
+        "Swiss Quality Development", 2000,
+        "Invest in R&D to meet Swiss quality standards",
+        ActionType.DEVELOPMENT
+    ),
+    ActionType.HIRING: GameAction(
+        "Recruit Talent", 3000,
+        "Hire from HSG graduates or international talent pool",
+        ActionType.HIRING
+    ),
+    ActionType.RESEARCH: GameAction(
+        "Market Research", 1000,
+        "Study St. Gallen market trends and local preferences",
+        ActionType.RESEARCH
+    ),
+    ActionType.EXPANSION: GameAction(
+        "Regional Expansion", 4000,
+        "Expand operations across Eastern Switzerland",
+        ActionType.EXPANSION
+    ),
+    ActionType.NOTHING: GameAction(
+        "Chill at Drei Weihern", 0,
+        "Take a relaxing day by the lakes, save money but miss opportunities",
+        ActionType.NOTHING
+    ),
+    ActionType.TAKE_LOAN: GameAction(
+        "Emergency Bank Loan", 0,
+        "Take a 5,000 CHF emergency loan (2,000 CHF/month for 3 months)",
+        ActionType.TAKE_LOAN
+    ),
+    ActionType.GO_BANKRUPT: GameAction(
+        "Declare Bankruptcy", 0,
+        "Give up and close the company",
+        ActionType.GO_BANKRUPT
+    )
+})
+
+# The same actions as a tuple indexed directly by ActionType
+_ACTIONS_BY_TYPE = tuple(ACTIONS[action_type] for action_type in ActionType)
+
+# Each action's fixed "Invested" line, formatted once
+_INVESTED_MESSAGES = tuple(f"💸 Invested {action.cost:,} CHF in {action.name}" for action in _ACTIONS_BY_TYPE)
+
+
 class StartupTycoonGame:
     """Main game controller class for St. Gallen Startup Tycoon."""
     
     def __init__(self):
         
-        # Define available actions
-        self.actions = {
-            ActionType.MARKETING: GameAction(
-                "HSG Campus Marketing", 1500,
-                "Target wealthy HSG students with premium marketing campaign",
-                ActionType.MARKETING
-            ),
-            ActionType.DEVELOPMENT: GameAction(
-                "Swiss Quality Development", 2000,
-                "Invest in R&D to meet Swiss quality standards",
-                ActionType.DEVELOPMENT
-            ),
-            ActionType.HIRING: GameAction(
-                "Recruit Talent", 3000,
-                "Hire from HSG graduates or international talent pool",
-                ActionType.HIRING
-            ),
-            ActionType.RESEARCH: GameAction(
-                "Market Research", 1000,
-                "Study St. Gallen market trends and local preferences",
-                ActionType.RESEARCH
-            ),
-            ActionType.EXPANSION: GameAction(
-                "Regional Expansion", 4000,
-                "Expand operations across Eastern Switzerland",
-                ActionType.EXPANSION
-            ),
-            ActionType.NOTHING: GameAction(
-                "Chill at Drei Weihern", 0,
-                "Take a relaxing day by the lakes, save money but miss opportunities",
-                ActionType.NOTHING
-            ),
-            ActionType.TAKE_LOAN: GameAction(
-                "Emergency Bank Loan", 0,
-                "Take a 5,000 CHF emergency loan (2,000 CHF/month for 3 months)",
-                ActionType.TAKE_LOAN
-            ),
-            ActionType.GO_BANKRUPT: GameAction(
-                "Declare Bankruptcy", 0,
-                "Give up and close the company",
-                ActionType.GO_BANKRUPT
-            )
+        self.actions = ACTIONS
+        self._handlers = {
+            ActionType.MARKETING: self._apply_marketing,
+            ActionType.DEVELOPMENT: self._apply_development,
+            ActionType.HIRING: self._apply_hiring,
+            ActionType.RESEARCH: self._apply_research,
+            ActionType.EXPANSION: self._apply_expansion,
+            ActionType.NOTHING: self._apply_nothing,
         }
     
     def execute_action(self, company: Company, action_type: ActionType) -> str:
         """Execute a player action and return the result description."""
-        action = self.actions[action_type]
+        action = _ACTIONS_BY_TYPE[action_type]
         
         # Handle special debt actions
         if action_type == ActionType.TAKE_LOAN:
@@ -211,61 +266,70 @@ class StartupTycoonGame:
         
         # Deduct cost
         company.balance -= action.cost
-        result_messages = [f"💸 Invested {action.cost:,} CHF in {action.name}"]
+        result_messages = [_INVESTED_MESSAGES[action_type]]
         
         # Apply action effects with St. Gallen flavor
-        if action_type == ActionType.MARKETING:
-            customer_gain = random.randint(15, 35)
-            reputation_gain = random.uniform(0.1, 0.3)
-            
-            # Apply marketing boost if active (from economic boom)
-            if company.marketing_boost > 0:
-                customer_gain *= 2
-                reputation_gain *= 2
-                company.marketing_boost -= 1
-                result_messages.append("🚀 Marketing boost active - DOUBLE EFFECT!")
-            
-            company.customers += customer_gain
-            company.reputation += reputation_gain
-            result_messages.append(f"🎓 HSG students noticed your campaign! +{customer_gain} customers, reputation +{reputation_gain:.1f}")
-            
-        elif action_type == ActionType.DEVELOPMENT:
-            quality_gain = random.uniform(0.3, 0.5)
-            customer_gain = random.randint(5, 15)
-            company.product_quality += quality_gain
-            company.customers += customer_gain
-            result_messages.append(f"🔧 Swiss-quality improvements! Product quality +{quality_gain:.1f}, attracted {customer_gain} customers")
-            
-        elif action_type == ActionType.HIRING:
-            company.employees += 1
-            productivity_boost = random.randint(8, 20)
-            company.customers += productivity_boost
-            company.product_quality += random.uniform(0.1, 0.2)
-            result_messages.append(f"👨‍💼 Hired talented professional! Team productivity boosted, +{productivity_boost} customers")
-            
-        elif action_type == ActionType.RESEARCH:
-            company.research_protection += 1
-            market_insight = random.randint(5, 12)
-            company.customers += market_insight
-            result_messages.append(f"🔬 St. Gallen market research complete! Risk reduced, +{market_insight} customers from insights")
-            
-        elif action_type == ActionType.EXPANSION:
-            customer_gain = random.randint(25, 45)
-            reputation_gain = random.uniform(0.2, 0.4)
-            quality_gain = random.uniform(0.2, 0.4)
-            company.customers += customer_gain
-            company.reputation += reputation_gain
-            company.product_quality += quality_gain
-            company.employees += 1
-            result_messages.append(f"🏢 Eastern Switzerland expansion! +{customer_gain} customers, +1 employee, all metrics boosted")
-            
-        elif action_type == ActionType.NOTHING:
-            # Small chance of positive outcome from relaxing
-            if random.random() < 0.3:
-                inspiration = random.randint(3, 8)
-                company.customers += inspiration
-                result_messages.append(f"🏖️ Relaxing at Drei Weihern sparked inspiration! +{inspiration} customers from word-of-mouth")
-            else:
-                result_messages.append("😴 Enjoyed the beautiful St. Gallen scenery but missed business opportunities")
+        result_messages.extend(self._handlers[action_type](company))
         
         return "\n".join(result_messages)
+    
+    def _apply_marketing(self, company: Company) -> List[str]:
+        """Apply a marketing campaign, doubled while a boost is active."""
+        customer_gain = random.randint(15, 35)
+        reputation_gain = 0.1 + 0.2 * random.random()
+        messages = []
+        
+        # Apply marketing boost if active (from economic boom)
+        if company.marketing_boost > 0:
+            customer_gain *= 2
+            reputation_gain *= 2
+            company.marketing_boost -= 1
+            messages.append("🚀 Marketing boost active - DOUBLE EFFECT!")
+        
+        company.customers += customer_gain
+        company.reputation += reputation_gain
+        messages.append(f"🎓 HSG students noticed your campaign! +{customer_gain} customers, reputation +{reputation_gain:.1f}")
+        return messages
+    
+    def _apply_development(self, company: Company) -> List[str]:
+        """Improve product quality and attract a few customers."""
+        quality_gain = 0.3 + 0.2 * random.random()
+        customer_gain = random.randint(5, 15)
+        company.product_quality += quality_gain
+        company.customers += customer_gain
+        return [f"🔧 Swiss-quality improvements! Product quality +{quality_gain:.1f}, attracted {customer_gain} customers"]
+    
+    def _apply_hiring(self, company: Company) -> List[str]:
+        """Add an employee and the customers they bring in."""
+        company.employees += 1
+        productivity_boost = random.randint(8, 20)
+        company.customers += productivity_boost
+        company.product_quality += 0.1 + 0.1 * random.random()
+        return [f"👨‍💼 Hired talented professional! Team productivity boosted, +{productivity_boost} customers"]
+    
+    def _apply_research(self, company: Company) -> List[str]:
+        """Add research protection and a few customers."""
+        company.research_protection += 1
+        market_insight = random.randint(5, 12)
+        company.customers += market_insight
+        return [f"🔬 St. Gallen market research complete! Risk reduced, +{market_insight} customers from insights"]
+    
+    def _apply_expansion(self, company: Company) -> List[str]:
+        """Expand regionally, boosting every metric."""
+        customer_gain = random.randint(25, 45)
+        reputation_gain = 0.2 + 0.2 * random.random()
+        quality_gain = 0.2 + 0.2 * random.random()
+        company.customers += customer_gain
+        company.reputation += reputation_gain
+        company.product_quality += quality_gain
+        company.employees += 1
+        return [f"🏢 Eastern Switzerland expansion! +{customer_gain} customers, +1 employee, all metrics boosted"]
+    
+    def _apply_nothing(self, company: Company) -> List[str]:
+        """Take the day off, with a small chance of word-of-mouth customers."""
+        # Small chance of positive outcome from relaxing
+        if random.random() < 0.3:
+            inspiration = random.randint(3, 8)
+            company.customers += inspiration
+            return [f"🏖️ Relaxing at Drei Weihern sparked inspiration! +{inspiration} customers from word-of-mouth"]
+        return ["😴 Enjoyed the beautiful St. Gallen scenery but missed business opportunities"]
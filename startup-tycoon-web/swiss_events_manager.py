@@ -4,6 +4,8 @@ Swiss Events Manager - St. Gallen Startup Events
 Event system for the Startup Tycoon web game.
 """
 
+import bisect
+import operator
 import random
 from typing import TYPE_CHECKING
 
@@ -11,11 +13,88 @@ if TYPE_CHECKING:
     from startup_tycoon_main import Company
 
 
+# Bound once at import; still the global generator, so random.seed()
+# reproduces events together with the rest of the game
+_randint = random.randint
+_random = random.random
+_shuffle = random.shuffle
+
+# Fixed text pools, built once at import and indexed with one _random() draw
+NEWSPAPERS = ("St. Galler Tagblatt", "NZZ", "Blick", "20 Minuten")
+VIOLATIONS = ("Data protection violation", "Anti-competitive behavior", "Tax irregularity")
+QUIT_REASONS = ("better offer", "burnout", "moving to Zurich", "starting own startup")
+SHITSTORM_REASONS = ("bad customer service", "problematic tweets", "greenwashing accusations", "overpriced products")
+DOG_NAMES = ("Bitzli", "Rüdiger", "Fondue", "Heidi", "Wilhelm Tell")
+MISS_REASONS = ("overslept", "stuck in traffic", "wrong address", "phone alarm failed")
+MIDDLE_MESSAGES = (
+    "📈 Solid performance! You were more successful than SBB's punctuality.",
+    "👏 Not bad! You achieved more than a tourist trying to pronounce Chuchichäschtli.",
+    "⚖️ Balanced like a Swiss bank account - neither poor nor rich, but stable!",
+    "🎯 Midfield like Switzerland at Eurovision - always participating, rarely at the top.",
+    "🍫 Decent like Swiss chocolate - not the best, but still pretty sweet!",
+)
+BANKRUPTCY_MESSAGES = (
+    "💀 Bankrupt! You're broke like a Swiss person without health insurance.",
+    "🚨 Bankruptcy! Even your emergency fund has quit.",
+    "📉 Broke! You have less money than a student after the first week of semester.",
+    "💸 Bankrupt! Your account balance is more negative than February weather in St. Gallen.",
+    "🍴 Game Over! Time to move back in with mom and eat <nudle mit pesto>.",
+    "💔 Bankrupt! Your startup dream crashed harder than the Swiss national football team's World Cup hopes.",
+)
+
+# Endgame tiers by final balance. A 1st place gets the message of the highest
+# threshold its balance exceeds; a poor performance gets the message of the
+# first threshold its balance is below, if any.
+VICTORY_THRESHOLDS = (20000, 30000, 50000)
+VICTORY_MESSAGES = (
+    "🎉 Congrats! You have more customers than FC St. Gallen has fans in Kybunpark!",
+    "👑 Your coffers are so full, you could almost afford a apartment on the Rosenberg!",
+    "👑 Your coffers are so full, you could almost afford a studio in Zurich!",
+    "💰 Your treasure chest is fuller than the HSG library during finals!",
+)
+LOSS_THRESHOLDS = (-2000, 5000)
+LOSS_MESSAGES = (
+    "💸 Game Over: You went bankrupt faster than a Basel resident finding affordable housing in Zurich.",
+    "📉 Game Over: Your cash fell deeper than the fog line in November in St. Gallen.",
+)
+
+# Single-stat achievements in display order: (stat, threshold, message)
+THRESHOLD_ACHIEVEMENTS = (
+    ('customers', 500, "🌟 'Customer Magnet': More <fans> than Trischli on wednesday!"),
+    ('reputation', 3.0, "⭐ 'Reputation King': More popular than drei Weiern on sunny Sunday!"),
+    ('product_quality', 3.0, "🔧  'Quality Guru': More precise than a Swiss watch!"),
+    ('employees', 10, "👥 'Team Builder': More employees than some mountain huts have beds!"),
+    ('balance', 100000, "💎 'Money Magnate': Richer than a Zurich banker!"),
+)
+_get_achievement_stats = operator.attrgetter(*(stat for stat, _, _ in THRESHOLD_ACHIEVEMENTS))
+
+
+def _build_alias_table(weights):
+    """Build Vose's alias table (prob, alias) for sampling weights in O(1)."""
+    count = len(weights)
+    total = sum(weights)
+    scaled = [weight * count / total for weight in weights]
+    prob = [1.0] * count
+    alias = list(range(count))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        less = small.pop()
+        more = large.pop()
+        prob[less] = scaled[less]
+        alias[less] = more
+        scaled[more] -= 1.0 - scaled[less]
+        (small if scaled[more] < 1.0 else large).append(more)
+    # Whatever is left is 1.0 up to rounding and keeps prob 1.0
+    return tuple(prob), tuple(alias)
+
+
 class SwissEventManager:
     """Manages all Swiss-themed events for the startup game."""
     
     def __init__(self):
         self.setup_events()
+        self._bankruptcy_deck = []
     
     def setup_events(self):
         """Initialize all events with their probabilities."""
@@ -59,54 +138,51 @@ class SwissEventManager:
             ("Founder Misses Pitch", self.founder_misses_pitch_event, 0.06),
             ("Comic Sans Code", self.comic_sans_code_event, 0.05),
         ]
+        
+        # The listed probabilities are relative weights: the alias table
+        # normalizes them, so every event stays reachable when they add up to
+        # more than 1, and a perfect day takes any mass left below 1
+        funcs = [func for _, func, _ in self.events]
+        weights = [probability for _, _, probability in self.events]
+        total = sum(weights)
+        if total < 1.0:
+            funcs.append(self.perfect_day_event)
+            weights.append(1.0 - total)
+        
+        # Parallel columns for the hot path: the static handler functions and
+        # their alias table, so a draw costs the same whatever the event count
+        self._funcs = tuple(funcs)
+        self._alias_prob, self._alias_idx = _build_alias_table(weights)
     
     def trigger_random_event(self, company) -> str:
         """Trigger a random event based on probabilities."""
-        roll = random.random()
-        cumulative_prob = 0
-        
-        for event_name, event_func, probability in self.events:
-            cumulative_prob += probability
-            if roll <= cumulative_prob:
-                return event_func(company)
-        
-        return "📊 Perfect day in beautiful St. Gallen! Everything runs smoothly!"
+        # One roll picks the column (integer part) and decides between it
+        # and its alias (fractional part)
+        roll = _random() * len(self._funcs)
+        index = int(roll)
+        if roll - index >= self._alias_prob[index]:
+            index = self._alias_idx[index]
+        return self._funcs[index](company)
 
     # ===== HUMOROUS MESSAGES =====
 
     def get_humorous_endgame_message(self, company, rank, total_players):
         """Returns humorous end messages based on performance"""
-        score = company.calculate_score()
         balance = company.balance
         
-        # Victory messages (1st place)
+        # Victory messages (1st place), one tier per balance threshold passed
         if rank == 1:
-            if balance > 50000:
-                return "💰 Your treasure chest is fuller than the HSG library during finals!"
-            elif balance > 30000:
-                return "👑 Your coffers are so full, you could almost afford a studio in Zurich!"
-            elif balance > 20000:
-                return "👑 Your coffers are so full, you could almost afford a apartment on the Rosenberg!"
-            else:
-                return "🎉 Congrats! You have more customers than FC St. Gallen has fans in Kybunpark!"
+            return VICTORY_MESSAGES[bisect.bisect_left(VICTORY_THRESHOLDS, balance)]
         
         # Middle places
         elif rank <= total_players // 2:
-            middle_messages = [
-                "📈 Solid performance! You were more successful than SBB's punctuality.",
-                "👏 Not bad! You achieved more than a tourist trying to pronounce Chuchichäschtli.",
-                "⚖️ Balanced like a Swiss bank account - neither poor nor rich, but stable!",
-                "🎯 Midfield like Switzerland at Eurovision - always participating, rarely at the top.",
-                "🍫 Decent like Swiss chocolate - not the best, but still pretty sweet!"
-            ]
-            return random.choice(middle_messages)
+            return MIDDLE_MESSAGES[int(_random() * len(MIDDLE_MESSAGES))]
         
         # Poor performance
         else:
-            if balance < -2000:
-                return "💸 Game Over: You went bankrupt faster than a Basel resident finding affordable housing in Zurich."
-            elif balance < 5000:
-                return "📉 Game Over: Your cash fell deeper than the fog line in November in St. Gallen."
+            tier = bisect.bisect_right(LOSS_THRESHOLDS, balance)
+            if tier < len(LOSS_MESSAGES):
+                return LOSS_MESSAGES[tier]
             elif company.reputation < 0.5:
                 return "😬 Your reputation is so bad, even spam emails are more popular."
             else:
@@ -117,228 +193,241 @@ class SwissEventManager:
 
     def get_bankruptcy_message(self):
         """Special messages for bankruptcy"""
-        bankruptcy_messages = [
-            "💀 Bankrupt! You're broke like a Swiss person without health insurance.",
-            "🚨 Bankruptcy! Even your emergency fund has quit.",
-            "📉 Broke! You have less money than a student after the first week of semester.",
-            "💸 Bankrupt! Your account balance is more negative than February weather in St. Gallen.",
-            "🍴 Game Over! Time to move back in with mom and eat <nudle mit pesto>.",
-            "💔 Bankrupt! Your startup dream crashed harder than the Swiss national football team's World Cup hopes."
-        ]
-        return random.choice(bankruptcy_messages)
+        # Deal from a shuffled deck, reshuffled once every message was shown;
+        # list.pop() is atomic, so threads sharing the manager never collide
+        try:
+            return self._bankruptcy_deck.pop()
+        except IndexError:
+            deck = list(BANKRUPTCY_MESSAGES)
+            _shuffle(deck)
+            self._bankruptcy_deck = deck
+            return deck.pop()
 
     def get_special_achievement_messages(self, company):
         """Special achievement messages for exceptional performance"""
-        achievements = []
-        
-        if company.customers > 500:
-            achievements.append("🌟 'Customer Magnet': More <fans> than Trischli on wednesday!")
-        
-        if company.reputation > 3.0:
-            achievements.append("⭐ 'Reputation King': More popular than drei Weiern on sunny Sunday!")
+        # One attribute read per stat, shared by the compound checks below
+        stats = _get_achievement_stats(company)
+        customers, reputation, _, employees, balance = stats
+        achievements = [message for value, (_, threshold, message) in zip(stats, THRESHOLD_ACHIEVEMENTS)
+                        if value > threshold]
         
-        if company.product_quality > 3.0:
-            achievements.append("🔧  'Quality Guru': More precise than a Swiss watch!")
-        
-        if company.employees > 10:
-            achievements.append("👥 'Team Builder': More employees than some mountain huts have beds!")
-        
-        if company.balance > 100000:
-            achievements.append("💎 'Money Magnate': Richer than a Zurich banker!")
-        
-        if hasattr(company, 'months_survived') and company.months_survived == 12 and company.balance > 0:
+        if company.months_survived == 12 and balance > 0:
             achievements.append("🏔️ 'Survival Artist': Survived 12 months like a real HSG Student!")
         
-        if company.customers > 200 and company.reputation > 2.0:
+        if customers > 200 and reputation > 2.0:
             achievements.append("🎓 'HSG Favorite': Even the snobby business students approve!")
         
-        if company.balance > 100000 and company.employees > 10:
+        if balance > 100000 and employees > 10:
             achievements.append("🏢 'St. Gallen Success Story': From Drei Weihern dreamer to business mogul!")
         
         return achievements
 
+    @staticmethod
+    def perfect_day_event(company):
+        return "📊 Perfect day in beautiful St. Gallen! Everything runs smoothly!"
+
     # Economic Events
-    def economic_boom_event(self, company):
+    @staticmethod
+    def economic_boom_event(company):
         company.marketing_boost = 2
-        customer_gain = random.randint(15, 25)
+        customer_gain = _randint(15, 25)
         company.customers += customer_gain
         return f"📈 Economic boom in Switzerland! +{customer_gain} customers. Marketing actions will have DOUBLE EFFECT for the next 2 turns!"
 
-    def recession_event(self, company):
+    @staticmethod
+    def recession_event(company):
         customer_loss = max(1, int(company.customers * 0.10))
-        company.customers = max(0, company.customers - customer_loss)
+        company.lose_customers(customer_loss)
         return f"📉 Recession hits Switzerland! Lost: {customer_loss} customers (-10%)."
 
-    def interest_rate_rise_event(self, company):
+    @staticmethod
+    def interest_rate_rise_event(company):
         additional_costs = 500
         company.monthly_expenses += additional_costs
         return f"📊 SNB raises interest rate! Monthly costs increase by {additional_costs} CHF."
 
-    def tax_reduction_event(self, company):
+    @staticmethod
+    def tax_reduction_event(company):
         cost_saving = 500
-        company.monthly_expenses = max(100, company.monthly_expenses - cost_saving)
+        expenses = company.monthly_expenses - cost_saving
+        company.monthly_expenses = expenses if expenses > 100 else 100
         return f"🎉 Tax reduction for startups! Monthly costs reduced by {cost_saving} CHF."
 
     # St. Gallen Location Events
-    def hsg_career_fair_event(self, company):
-        customer_gain = random.randint(20, 40)
-        reputation_gain = random.uniform(0.2, 0.4)
+    @staticmethod
+    def hsg_career_fair_event(company):
+        customer_gain = _randint(20, 40)
+        reputation_gain = 0.2 + 0.2 * _random()
         company.customers += customer_gain
         company.reputation += reputation_gain
         return f"🎓 HSG career fair success! +{customer_gain} customers, reputation boosted!"
     
-    def hsg_library_crisis_event(self, company):
+    @staticmethod
+    def hsg_library_crisis_event(company):
         if company.product_quality > 2.0:
-            customer_gain = random.randint(30, 50)
+            customer_gain = _randint(30, 50)
             company.customers += customer_gain
             return f"📚 HSG students love your quality product! +{customer_gain} customers!"
         else:
-            customer_loss = random.randint(5, 15)
-            company.customers = max(0, company.customers - customer_loss)
+            customer_loss = _randint(5, 15)
+            company.lose_customers(customer_loss)
             return f"📚 HSG students tried your product but it wasn't good enough! -{customer_loss} customers"
     
-    def trischli_disaster_event(self, company):
-        employee_cost = company.employees * random.randint(200, 500)
+    @staticmethod
+    def trischli_disaster_event(company):
+        employee_cost = company.employees * _randint(200, 500)
         company.balance -= employee_cost
         return f"🍺 Employees partied too hard at Trischli! Productivity lost: -{employee_cost:,} CHF"
     
-    def trischli_success_event(self, company):
-        customer_gain = random.randint(25, 45)
+    @staticmethod
+    def trischli_success_event(company):
+        customer_gain = _randint(25, 45)
         company.customers += customer_gain
-        company.reputation += random.uniform(0.1, 0.3)
+        company.reputation += 0.1 + 0.2 * _random()
         return f"🎉 Trischli event sponsorship success! +{customer_gain} customers!"
     
-    def olma_partnership_event(self, company):
-        revenue_boost = random.randint(1500, 3000)
+    @staticmethod
+    def olma_partnership_event(company):
+        revenue_boost = _randint(1500, 3000)
         company.balance += revenue_boost
-        customer_gain = random.randint(15, 30)
+        customer_gain = _randint(15, 30)
         company.customers += customer_gain
         return f"🌭 Olma Bratwurst partnership! +{revenue_boost:,} CHF, +{customer_gain} customers!"
     
-    def rosenberg_investment_event(self, company):
+    @staticmethod
+    def rosenberg_investment_event(company):
         if company.reputation > 2.5:
-            investment = random.randint(5000, 8000)
+            investment = _randint(5000, 8000)
             company.balance += investment
             return f"💎 Rosenberg elite investment! +{investment:,} CHF!"
         else:
             return "💎 Rosenberg kids said 'not exclusive enough, darling'"
     
-    def drei_weihern_party_event(self, company):
-        if random.random() < 0.7:
-            customer_gain = random.randint(20, 40)
+    @staticmethod
+    def drei_weihern_party_event(company):
+        if _random() < 0.7:
+            customer_gain = _randint(20, 40)
             company.customers += customer_gain
-            company.reputation += random.uniform(0.2, 0.4)
+            company.reputation += 0.2 + 0.2 * _random()
             return f"🏖️ Drei Weihern party was legendary! +{customer_gain} customers!"
         else:
-            damage = random.randint(800, 1500)
+            damage = _randint(800, 1500)
             company.balance -= damage
             return f"🏖️ Drei Weihern party got out of hand... cleanup costs: -{damage:,} CHF"
 
     # Positive Events
-    def startup_award_event(self, company):
+    @staticmethod
+    def startup_award_event(company):
         prize_money = 3000
         reputation_gain = 0.5
         company.balance += prize_money
         company.reputation += reputation_gain
-        customer_gain = random.randint(10, 20)
+        customer_gain = _randint(10, 20)
         company.customers += customer_gain
         return f"🏆 Won St. Gallen Startup Award! +{prize_money:,} CHF, +{customer_gain} customers!"
 
-    def viral_tiktok_event(self, company):
-        customer_gain = random.randint(70, 90)
-        reputation_gain = random.uniform(0.3, 0.5)
+    @staticmethod
+    def viral_tiktok_event(company):
+        customer_gain = _randint(70, 90)
+        reputation_gain = 0.3 + 0.2 * _random()
         company.customers += customer_gain
         company.reputation += reputation_gain
         return f"📱 TikTok video goes viral! +{customer_gain} new followers!"
 
-    def good_press_event(self, company):
+    @staticmethod
+    def good_press_event(company):
         reputation_gain = 0.3
-        customer_gain = random.randint(15, 25)
+        customer_gain = _randint(15, 25)
         company.reputation += reputation_gain
         company.customers += customer_gain
-        newspapers = ["St. Galler Tagblatt", "NZZ", "Blick", "20 Minuten"]
-        newspaper = random.choice(newspapers)
+        newspaper = NEWSPAPERS[int(_random() * len(NEWSPAPERS))]
         return f"📰 Positive article in {newspaper}! +{customer_gain} customers!"
     
-    def innovation_grant_event(self, company):
-        grant = random.randint(2000, 5000)
+    @staticmethod
+    def innovation_grant_event(company):
+        grant = _randint(2000, 5000)
         company.balance += grant
         return f"🏛️ St. Gallen innovation grant received! +{grant:,} CHF!"
     
-    def tourist_boom_event(self, company):
-        revenue_boost = random.randint(2000, 4000)
+    @staticmethod
+    def tourist_boom_event(company):
+        revenue_boost = _randint(2000, 4000)
         company.balance += revenue_boost
-        customer_gain = random.randint(15, 35)
+        customer_gain = _randint(15, 35)
         company.customers += customer_gain
         return f"🎿 Tourist season brings international attention! +{revenue_boost:,} CHF, +{customer_gain} customers!"
 
     # Negative Events
-    def server_crash_event(self, company):
-        quality_loss = random.uniform(0.15, 0.25)
-        reputation_loss = random.uniform(0.15, 0.25)
-        customer_loss = random.randint(8, 15)
-        company.product_quality = max(0.1, company.product_quality - quality_loss)
-        company.reputation = max(0.1, company.reputation - reputation_loss)
-        company.customers = max(0, company.customers - customer_loss)
+    @staticmethod
+    def server_crash_event(company):
+        quality_loss = 0.15 + 0.1 * _random()
+        reputation_loss = 0.15 + 0.1 * _random()
+        customer_loss = _randint(8, 15)
+        company.lose_quality(quality_loss)
+        company.lose_reputation(reputation_loss)
+        company.lose_customers(customer_loss)
         return f"💥 Server crash! Quality and reputation suffer, {customer_loss} customers leave!"
 
-    def legal_fine_event(self, company):
-        fine = random.randint(1800, 2200)
+    @staticmethod
+    def legal_fine_event(company):
+        fine = _randint(1800, 2200)
         if company.research_protection > 0:
             fine = max(500, fine - (company.research_protection * 300))
             protection_text = " (Reduced by Research Protection!)"
         else:
             protection_text = ""
         company.balance -= fine
-        company.reputation -= random.uniform(0.1, 0.2)
-        violations = ["Data protection violation", "Anti-competitive behavior", "Tax irregularity"]
-        violation = random.choice(violations)
+        company.reputation -= 0.1 + 0.1 * _random()
+        violation = VIOLATIONS[int(_random() * len(VIOLATIONS))]
         return f"⚖️ Legal penalty: {violation}! -{fine:,} CHF fine{protection_text}"
 
-    def employee_quits_event(self, company):
+    @staticmethod
+    def employee_quits_event(company):
         if company.employees <= 1:
             return "👋 An employee wanted to quit, but you're alone in the team anyway!"
         company.employees -= 1
-        quality_loss = random.uniform(0.1, 0.2)
-        customer_loss = random.randint(5, 12)
-        company.product_quality = max(0.1, company.product_quality - quality_loss)
-        company.customers = max(0, company.customers - customer_loss)
-        quit_reasons = ["better offer", "burnout", "moving to Zurich", "starting own startup"]
-        reason = random.choice(quit_reasons)
+        quality_loss = 0.1 + 0.1 * _random()
+        customer_loss = _randint(5, 12)
+        company.lose_quality(quality_loss)
+        company.lose_customers(customer_loss)
+        reason = QUIT_REASONS[int(_random() * len(QUIT_REASONS))]
         return f"👋 Key employee quits due to '{reason}'. -1 Employee, quality suffers, {customer_loss} customers unhappy"
 
-    def big_customer_leaves_event(self, company):
-        customer_loss = random.randint(25, 35)
-        revenue_loss = random.randint(800, 1200)
-        company.customers = max(0, company.customers - customer_loss)
+    @staticmethod
+    def big_customer_leaves_event(company):
+        customer_loss = _randint(25, 35)
+        revenue_loss = _randint(800, 1200)
+        company.lose_customers(customer_loss)
         company.balance -= revenue_loss
-        company.reputation -= random.uniform(0.1, 0.2)
+        company.reputation -= 0.1 + 0.1 * _random()
         return f"😤 Big customer switches to competition! -{customer_loss} customers, -{revenue_loss:,} CHF lost"
 
-    def social_media_shitstorm_event(self, company):
-        reputation_loss = random.uniform(0.4, 0.6)
-        customer_loss = random.randint(20, 40)
-        company.reputation = max(0.1, company.reputation - reputation_loss)
-        company.customers = max(0, company.customers - customer_loss)
-        shitstorm_reasons = ["bad customer service", "problematic tweets", "greenwashing accusations", "overpriced products"]
-        reason = random.choice(shitstorm_reasons)
+    @staticmethod
+    def social_media_shitstorm_event(company):
+        reputation_loss = 0.4 + 0.2 * _random()
+        customer_loss = _randint(20, 40)
+        company.lose_reputation(reputation_loss)
+        company.lose_customers(customer_loss)
+        reason = SHITSTORM_REASONS[int(_random() * len(SHITSTORM_REASONS))]
         return f"💩 Social media shitstorm due to '{reason}'! {customer_loss} customers boycott you"
 
-    def fraud_accusations_event(self, company):
-        reputation_loss = random.uniform(0.8, 1.2)
-        fine = random.randint(1200, 1800)
-        customer_loss = random.randint(15, 30)
-        company.reputation = max(0.1, company.reputation - reputation_loss)
+    @staticmethod
+    def fraud_accusations_event(company):
+        reputation_loss = 0.8 + 0.4 * _random()
+        fine = _randint(1200, 1800)
+        customer_loss = _randint(15, 30)
+        company.lose_reputation(reputation_loss)
         company.balance -= fine
-        company.customers = max(0, company.customers - customer_loss)
+        company.lose_customers(customer_loss)
         return f"🚨 Fraud accusations! -{fine:,} CHF legal costs, {customer_loss} customers leave"
 
-    def ceo_affair_event(self, company):
-        reputation_loss = random.uniform(0.3, 0.5)
-        customer_loss = random.randint(8, 20)
-        legal_costs = random.randint(800, 1500)
-        company.reputation = max(0.1, company.reputation - reputation_loss)
-        company.customers = max(0, company.customers - customer_loss)
+    @staticmethod
+    def ceo_affair_event(company):
+        reputation_loss = 0.3 + 0.2 * _random()
+        customer_loss = _randint(8, 20)
+        legal_costs = _randint(800, 1500)
+        company.lose_reputation(reputation_loss)
+        company.lose_customers(customer_loss)
         company.balance -= legal_costs
         if company.employees > 2:
             company.employees -= 1
@@ -347,51 +436,55 @@ class SwissEventManager:
             additional_text = ""
         return f"💔 CEO scandal in Blick! -{legal_costs:,} CHF PR costs, {customer_loss} customers distance themselves{additional_text}"
     
-    def bureaucracy_event(self, company):
+    @staticmethod
+    def bureaucracy_event(company):
         if company.research_protection > 0:
             return "📋 Swiss bureaucracy delayed things, but your research team navigated it perfectly!"
         else:
-            delay_cost = random.randint(1000, 2500)
+            delay_cost = _randint(1000, 2500)
             company.balance -= delay_cost
             return f"📋 Swiss bureaucracy strikes again! Paperwork delays cost: -{delay_cost:,} CHF"
     
-    def cheese_crisis_event(self, company):
-        cost_increase = random.randint(500, 1200)
+    @staticmethod
+    def cheese_crisis_event(company):
+        cost_increase = _randint(500, 1200)
         company.balance -= cost_increase
         return f"🧀 Appenzeller cheese crisis affects supply chain! Operating costs up: -{cost_increase:,} CHF"
 
     # Fun Events
-    def startup_dog_mascot_event(self, company):
-        customer_gain = random.randint(18, 22)
-        reputation_gain = random.uniform(0.25, 0.35)
-        monthly_costs = random.randint(150, 250)
+    @staticmethod
+    def startup_dog_mascot_event(company):
+        customer_gain = _randint(18, 22)
+        reputation_gain = 0.25 + 0.1 * _random()
+        monthly_costs = _randint(150, 250)
         company.customers += customer_gain
         company.reputation += reputation_gain
         company.monthly_expenses += monthly_costs
-        dog_names = ["Bitzli", "Rüdiger", "Fondue", "Heidi", "Wilhelm Tell"]
-        dog_name = random.choice(dog_names)
+        dog_name = DOG_NAMES[int(_random() * len(DOG_NAMES))]
         return f"🐕 Startup dog '{dog_name}' becomes viral mascot! +{customer_gain} customers, but +{monthly_costs} CHF/month costs"
 
-    def intern_deletes_data_event(self, company):
-        customer_loss = random.randint(8, 12)
-        quality_loss = random.uniform(0.1, 0.2)
-        recovery_costs = random.randint(500, 1000)
-        company.customers = max(0, company.customers - customer_loss)
-        company.product_quality = max(0.1, company.product_quality - quality_loss)
+    @staticmethod
+    def intern_deletes_data_event(company):
+        customer_loss = _randint(8, 12)
+        quality_loss = 0.1 + 0.1 * _random()
+        recovery_costs = _randint(500, 1000)
+        company.lose_customers(customer_loss)
+        company.lose_quality(quality_loss)
         company.balance -= recovery_costs
         return f"🤦‍♂️ Intern deletes important data! -{customer_loss} customers, -{recovery_costs:,} CHF recovery costs"
 
-    def founder_misses_pitch_event(self, company):
+    @staticmethod
+    def founder_misses_pitch_event(company):
         company.no_revenue_this_month = True
-        reputation_loss = random.uniform(0.2, 0.3)
-        company.reputation = max(0.1, company.reputation - reputation_loss)
-        miss_reasons = ["overslept", "stuck in traffic", "wrong address", "phone alarm failed"]
-        reason = random.choice(miss_reasons)
+        reputation_loss = 0.2 + 0.1 * _random()
+        company.lose_reputation(reputation_loss)
+        reason = MISS_REASONS[int(_random() * len(MISS_REASONS))]
         return f"😴 Founder misses investor pitch due to '{reason}'! No revenue this month"
 
-    def comic_sans_code_event(self, company):
-        quality_loss = random.uniform(0.15, 0.25)
-        reputation_gain = random.uniform(0.15, 0.25)
-        company.product_quality = max(0.1, company.product_quality - quality_loss)
+    @staticmethod
+    def comic_sans_code_event(company):
+        quality_loss = 0.15 + 0.1 * _random()
+        reputation_gain = 0.15 + 0.1 * _random()
+        company.lose_quality(quality_loss)
         company.reputation += reputation_gain
         return f"🤪 Intern rewrites code in Comic Sans! Quality suffers but everyone laughs about it (+Reputation)"